@@ -5,8 +5,17 @@ import logging
 import getpass
 import re
 from datetime import datetime
-from typing import Union, Optional, Dict, Tuple, List, Any
+from typing import Union, Optional, Dict, Tuple, List, Any, Iterable
 import os
+from functools import lru_cache
+import csv
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for .npz export/import and strategy training
+    np = None
 
 
 # Constants
@@ -16,8 +25,22 @@ CHOICES = {
     "scissors": "✂️"
 }
 WINNING_COMBOS = {"rock": "scissors", "paper": "rock", "scissors": "paper"}
+BEATEN_BY = {loser: winner for winner, loser in WINNING_COMBOS.items()}  # The move that beats each move
 GAME_STATISTICS = "game_stats.json"
 MAX_ENTRIES = 3
+CHECKPOINT_FILE = "game_checkpoint.jsonl"
+CHECKPOINT_INTERVAL = 10 # Rounds between checkpoint writes
+PLAYER_PROFILES = "player_profiles.json"
+MOVE_LOG = "game_moves.jsonl" # One line of recorded moves per game
+BACKTEST_SHARD_SIZE = 100 # Move sequences per backtest task
+TRAINED_STRATEGY = "trained_strategy.json"
+TRAINER_CHAINS = 1024 # Self-play chains advanced by each NumPy operation
+TRAINER_BATCH_SIZE = 4096 # Self-play iterations per exploitability computation
+ROLLING_WINDOW = 50 # Rounds covered by the live win rate
+LIVE_STATS_REFRESH_RATE = 2 # Maximum live stats refreshes per second
+STATS_FIELDS = ["Mode", "Player 1", "Player 2", "Player 1 Wins", "Player 2 Wins", "Draws", "Total Rounds", "Time Limit", "Date"]
+MOVE_EXPORT_CHUNK = 65536 # Rows buffered per write when exporting moves to .npy
+MOVE_FIELDS = ["Game", "Round", "Mode", "Player 1", "Player 2", "Date", "Player 1 Move", "Player 2 Move"]
 
 
 # Set up logging
@@ -88,17 +111,27 @@ class Utilities:
 
 
     @staticmethod
-    def determine_winner(player_choice: str, opponent_choice: str, player_name="Player") -> str:
-        """Determine the winner of a round."""
+    def round_outcome(player_choice: str, opponent_choice: str) -> str:
+        """Return "win", "lose" or "tie" for the player, without printing."""
         if player_choice == opponent_choice:
-            print(f"It's a tie! Both chose {player_choice.capitalize()} {CHOICES[player_choice]}")
             return "tie"
         elif WINNING_COMBOS[player_choice] == opponent_choice:
-            print(f"{player_name} wins! {player_choice.capitalize()} {CHOICES[player_choice]} beats {opponent_choice.capitalize()} {CHOICES[opponent_choice]}")
             return "win"
         else:
-            print(f"{player_name} loses! {opponent_choice.capitalize()} {CHOICES[opponent_choice]} beats {player_choice.capitalize()} {CHOICES[player_choice]}")
             return "lose"
+
+
+    @staticmethod
+    def determine_winner(player_choice: str, opponent_choice: str, player_name="Player") -> str:
+        """Determine the winner of a round."""
+        outcome = Utilities.round_outcome(player_choice, opponent_choice)
+        if outcome == "tie":
+            print(f"It's a tie! Both chose {player_choice.capitalize()} {CHOICES[player_choice]}")
+        elif outcome == "win":
+            print(f"{player_name} wins! {player_choice.capitalize()} {CHOICES[player_choice]} beats {opponent_choice.capitalize()} {CHOICES[opponent_choice]}")
+        else:
+            print(f"{player_name} loses! {opponent_choice.capitalize()} {CHOICES[opponent_choice]} beats {player_choice.capitalize()} {CHOICES[player_choice]}")
+        return outcome
     
 
     @staticmethod
@@ -134,17 +167,30 @@ class Stats:
     @staticmethod
     def save_stats_to_file(stats: Dict[str, Any]) -> None:
         """Save the new game stats to the JSON file with a limit."""
+        Stats.append_statistics([stats])
+
+
+    @staticmethod
+    def append_statistics(new_stats: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Append a batch of game stats to the JSON file in a single write.
+        :param new_stats: Game stats to append, consumed one record at a time
+        :return: Number of records appended, and number of records dropped by the MAX_ENTRIES limit
+        """
         try:
             all_stats = Stats.load_statistics() # Load existing statistics
         except Exception as e:
             logging.error(f"Failed to load statistics: {e}")
             all_stats = []
 
-        # Append the current game stats
-        all_stats.append(stats)
+        # Append the new game stats
+        existing = len(all_stats)
+        all_stats.extend(new_stats)
+        added = len(all_stats) - existing
 
         # Enforce the MAX_ENTRIES limit
-        if len(all_stats) > MAX_ENTRIES:
+        dropped = max(0, len(all_stats) - MAX_ENTRIES)
+        if dropped:
             all_stats = all_stats[-MAX_ENTRIES:] # Keep only the latest MAX_ENTRIES
 
         try:
@@ -154,6 +200,37 @@ class Stats:
         except IOError as e:
             logging.error(f"Failed to save statistics: {e}")
             raise
+        return added, dropped
+
+
+    @staticmethod
+    def save_moves_to_file(record: Dict[str, Any]) -> None:
+        """Append the moves of a finished game to the move log."""
+        try:
+            with open(MOVE_LOG, "a") as file:
+                file.write(json.dumps(record) + "\n")
+        except IOError as e:
+            logging.error(f"Failed to save moves: {e}")
+
+
+    @staticmethod
+    def load_moves(path: str = MOVE_LOG):
+        """Stream the valid game records from the move log, skipping corrupt ones."""
+        try:
+            with open(path, "r") as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                        for key in ("Player 1", "Player 2"):
+                            moves = record[f"{key} Sequence"]
+                            if not isinstance(record[key], str) or not isinstance(moves, list) or not all(move in CHOICES for move in moves):
+                                raise ValueError("invalid move sequence")
+                    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                        logging.debug("Skipping corrupt move log entry.")
+                        continue
+                    yield record
+        except FileNotFoundError:
+            logging.warning("Move log not found. Play some games to record moves.")
 
 
     @staticmethod
@@ -165,79 +242,1018 @@ class Stats:
         print("-" * 40)
 
 
+class StatsExport:
+    @staticmethod
+    def export_statistics(path: str) -> Tuple[int, int]:
+        """
+        Export the statistics history to a CSV or NumPy .npz file, and the
+        per-round moves from the move log next to it: a "_moves" CSV file, or a
+        "_moves" directory of .npy files for a .npz export.
+        :param path: Destination file, the format is chosen by its extension
+        :return: Number of game records and number of rounds exported
+        """
+        all_stats = Stats.load_statistics()
+        if path.lower().endswith(".npz"):
+            StatsExport.write_npz(path, all_stats)
+            return len(all_stats), StatsExport.write_moves_npy(StatsExport.moves_path(path))
+
+        StatsExport.write_csv(path, all_stats)
+
+        # Only write a moves file when there are recorded moves
+        games = Stats.load_moves()
+        first = next(games, None)
+        if first is None:
+            return len(all_stats), 0
+        return len(all_stats), StatsExport.write_moves_csv(StatsExport.moves_path(path), chain([first], games))
+
+
+    @staticmethod
+    def moves_path(path: str) -> str:
+        """Where the per-round moves are exported to, next to the stats export."""
+        root, extension = os.path.splitext(path)
+        if extension.lower() == ".npz":
+            return f"{root}_moves"
+        return f"{root}_moves{extension}"
+
+
+    @staticmethod
+    def write_moves_csv(path: str, games: Iterable[Dict[str, Any]]) -> int:
+        """Write one CSV row per recorded round, streaming the games. Returns the number of rounds."""
+        rounds = 0
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(MOVE_FIELDS)
+            for game, record in enumerate(games):
+                for round_number, (player1_move, player2_move) in enumerate(zip(record["Player 1 Sequence"], record["Player 2 Sequence"]), 1):
+                    writer.writerow([game, round_number, record.get("Mode"), record["Player 1"], record["Player 2"], record.get("Date"), player1_move, player2_move])
+                    rounds += 1
+        return rounds
+
+
+    @staticmethod
+    def write_moves_npy(directory: str, log_path: str = MOVE_LOG, chunk_size: int = MOVE_EXPORT_CHUNK) -> int:
+        """
+        Write the recorded rounds as one memory-mappable .npy file per column.
+        Per-round columns ("game", "round", "player1_move", "player2_move") index
+        into the per-game columns ("game_player1", "game_player2", "game_mode",
+        "game_date"). Moves, players and modes are dictionary-encoded into the
+        "moves", "players" and "modes" files, with -1 for a missing mode.
+        The move log is read twice, once to size the columns and once to fill
+        them `chunk_size` rows at a time, so memory use does not grow with the log.
+        :return: Number of rounds written
+        """
+        if np is None:
+            raise ImportError("NumPy is required to export .npy files.")
+
+        game_count, round_count = 0, 0
+        for record in Stats.load_moves(log_path):
+            game_count += 1
+            round_count += min(len(record["Player 1 Sequence"]), len(record["Player 2 Sequence"]))
+        if not game_count:
+            return 0
+
+        os.makedirs(directory, exist_ok=True)
+
+        def open_column(name: str, dtype, length: int):
+            column_path = os.path.join(directory, f"{name}.npy")
+            if not length:
+                # An empty array cannot be memory-mapped for writing
+                np.save(column_path, np.empty(0, dtype=dtype))
+                return np.empty(0, dtype=dtype)
+            return np.lib.format.open_memmap(column_path, mode="w+", dtype=dtype, shape=(length,))
+
+        round_columns = {
+            "game": open_column("game", np.int32, round_count),
+            "round": open_column("round", np.int32, round_count),
+            "player1_move": open_column("player1_move", np.int8, round_count),
+            "player2_move": open_column("player2_move", np.int8, round_count),
+        }
+        game_columns = {
+            "game_player1": open_column("game_player1", np.int32, game_count),
+            "game_player2": open_column("game_player2", np.int32, game_count),
+            "game_mode": open_column("game_mode", np.int32, game_count),
+            "game_date": open_column("game_date", "U10", game_count),
+        }
+        round_buffers: Dict[str, List[Any]] = {name: [] for name in round_columns}
+        game_buffers: Dict[str, List[Any]] = {name: [] for name in game_columns}
+        offsets = {"rounds": 0, "games": 0}
+
+        def flush(columns: Dict[str, Any], buffers: Dict[str, List[Any]], key: str) -> None:
+            count = len(next(iter(buffers.values())))
+            start = offsets[key]
+            for name, buffer in buffers.items():
+                columns[name][start:start + count] = buffer
+                buffer.clear()
+            offsets[key] += count
+
+        move_codes = {move: i for i, move in enumerate(CHOICES)}
+        players: Dict[str, int] = {}
+        modes: Dict[str, int] = {}
+        for game, record in enumerate(Stats.load_moves(log_path)):
+            if game >= game_count:
+                break  # The log grew after it was sized
+            game_buffers["game_player1"].append(StatsExport.encode(players, record["Player 1"]))
+            game_buffers["game_player2"].append(StatsExport.encode(players, record["Player 2"]))
+            game_buffers["game_mode"].append(StatsExport.encode(modes, record.get("Mode")))
+            game_buffers["game_date"].append(record.get("Date") or "")
+            for round_number, (player1_move, player2_move) in enumerate(zip(record["Player 1 Sequence"], record["Player 2 Sequence"]), 1):
+                round_buffers["game"].append(game)
+                round_buffers["round"].append(round_number)
+                round_buffers["player1_move"].append(move_codes[player1_move])
+                round_buffers["player2_move"].append(move_codes[player2_move])
+                if len(round_buffers["game"]) >= chunk_size:
+                    flush(round_columns, round_buffers, "rounds")
+            if len(game_buffers["game_date"]) >= chunk_size:
+                flush(game_columns, game_buffers, "games")
+        flush(round_columns, round_buffers, "rounds")
+        flush(game_columns, game_buffers, "games")
+
+        for column in chain(round_columns.values(), game_columns.values()):
+            if isinstance(column, np.memmap):
+                column.flush()
+        np.save(os.path.join(directory, "moves.npy"), np.array(list(move_codes), dtype=str))
+        np.save(os.path.join(directory, "players.npy"), np.array(list(players), dtype=str))
+        np.save(os.path.join(directory, "modes.npy"), np.array(list(modes), dtype=str))
+        return offsets["rounds"]
+
+
+    @staticmethod
+    def write_csv(path: str, records: List[Dict[str, Any]]) -> None:
+        """Write stats records to CSV one row at a time."""
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=STATS_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            for record in records:
+                writer.writerow(record)
+
+
+    @staticmethod
+    def read_csv(path: str):
+        """Yield stats records from a CSV file one row at a time."""
+        with open(path, "r", newline="") as file:
+            for row in csv.DictReader(file):
+                record = {}
+                for field in STATS_FIELDS:
+                    value = row.get(field) or None
+                    if value is not None and field in ("Player 1 Wins", "Player 2 Wins", "Draws", "Total Rounds", "Time Limit"):
+                        value = int(value)
+                    record[field] = value
+                yield record
+
+
+    @staticmethod
+    def write_npz(path: str, records: List[Dict[str, Any]]) -> None:
+        """
+        Write stats records as columns to an uncompressed .npz file.
+        Player names and modes are dictionary-encoded as integer codes into
+        the "players" and "modes" arrays. A missing name, mode or time limit is
+        stored as -1 and a missing date as an empty string.
+        """
+        if np is None:
+            raise ImportError("NumPy is required to export .npz files.")
+
+        players: Dict[str, int] = {}
+        modes: Dict[str, int] = {}
+        count = len(records)
+        columns = {
+            "player1": np.empty(count, dtype=np.int32),
+            "player2": np.empty(count, dtype=np.int32),
+            "mode": np.empty(count, dtype=np.int32),
+            "player1_wins": np.empty(count, dtype=np.int64),
+            "player2_wins": np.empty(count, dtype=np.int64),
+            "draws": np.empty(count, dtype=np.int64),
+            "total_rounds": np.empty(count, dtype=np.int64),
+            "time_limit": np.empty(count, dtype=np.int64),
+            "date": np.empty(count, dtype="U10"),
+        }
+        for i, record in enumerate(records):
+            columns["player1"][i] = StatsExport.encode(players, record.get("Player 1"))
+            columns["player2"][i] = StatsExport.encode(players, record.get("Player 2"))
+            columns["mode"][i] = StatsExport.encode(modes, record.get("Mode"))
+            columns["player1_wins"][i] = record.get("Player 1 Wins") or 0
+            columns["player2_wins"][i] = record.get("Player 2 Wins") or 0
+            columns["draws"][i] = record.get("Draws") or 0
+            columns["total_rounds"][i] = record.get("Total Rounds") or 0
+            time_limit = record.get("Time Limit")
+            columns["time_limit"][i] = -1 if time_limit is None else time_limit
+            columns["date"][i] = record.get("Date") or ""
+
+        np.savez(
+            path,
+            players=np.array(list(players), dtype=str),
+            modes=np.array(list(modes), dtype=str),
+            **columns,
+        )
+
+
+    @staticmethod
+    def encode(codes: Dict[str, int], value: Optional[str]) -> int:
+        """Dictionary-encode a value, using -1 for a missing one."""
+        if value is None:
+            return -1
+        return codes.setdefault(str(value), len(codes))
+
+
+    @staticmethod
+    def decode(values, code: int) -> Optional[str]:
+        """Look up a dictionary-encoded value, mapping -1 back to None."""
+        if code < 0:
+            return None
+        return str(values[code])
+
+
+    @staticmethod
+    def read_npz(path: str):
+        """
+        Yield stats records from a .npz file written by write_npz.
+        NumPy cannot memory-map arrays inside an .npz, so each column is read
+        into memory once and the records are built from it one row at a time.
+        """
+        if np is None:
+            raise ImportError("NumPy is required to import .npz files.")
+
+        with np.load(path, allow_pickle=False) as data:
+            players = data["players"]
+            modes = data["modes"]
+            columns = {name: data[name] for name in data.files if name not in ("players", "modes")}
+
+        for i in range(len(columns["date"])):
+            time_limit = int(columns["time_limit"][i])
+            yield {
+                "Mode": StatsExport.decode(modes, columns["mode"][i]),
+                "Player 1": StatsExport.decode(players, columns["player1"][i]),
+                "Player 2": StatsExport.decode(players, columns["player2"][i]),
+                "Player 1 Wins": int(columns["player1_wins"][i]),
+                "Player 2 Wins": int(columns["player2_wins"][i]),
+                "Draws": int(columns["draws"][i]),
+                "Total Rounds": int(columns["total_rounds"][i]),
+                "Time Limit": None if time_limit < 0 else time_limit,
+                "Date": str(columns["date"][i]) or None,
+            }
+
+
+class RollingStats:
+    def __init__(self, window: int = ROLLING_WINDOW, refresh_rate: float = LIVE_STATS_REFRESH_RATE):
+        """
+        Live stats over the most recent rounds, using a fixed-size ring buffer.
+        :param window: Number of recent rounds the win rate covers
+        :param refresh_rate: Maximum number of live displays per second
+        """
+        self.window = max(1, window)
+        self.refresh_interval = 1 / refresh_rate if refresh_rate > 0 else 0.0
+        self.wins_buffer = [0] * self.window
+        self.index = 0
+        self.count = 0
+        self.wins = 0  # Running sum of wins_buffer
+        self.move_counts = {choice: 0 for choice in CHOICES}
+        self.streak_result: Optional[str] = None
+        self.streak_length = 0
+        self.last_display = float("-inf")
+
+
+    def update(self, result: str, move: str) -> None:
+        """Record one round for player 1 in O(1)."""
+        if self.count == self.window:
+            # Drop the oldest round from the running sum
+            self.wins -= self.wins_buffer[self.index]
+        else:
+            self.count += 1
+        won = 1 if result == "win" else 0
+        self.wins_buffer[self.index] = won
+        self.wins += won
+        self.index = (self.index + 1) % self.window
+
+        self.move_counts[move] += 1
+
+        if result == self.streak_result:
+            self.streak_length += 1
+        else:
+            self.streak_result, self.streak_length = result, 1
+
+
+    def replay(self, player1_moves: List[str], player2_moves: List[str]) -> None:
+        """Rebuild the live stats from the moves of a resumed game."""
+        for player1_choice, player2_choice in zip(player1_moves, player2_moves):
+            self.update(Utilities.round_outcome(player1_choice, player2_choice), player1_choice)
+
+
+    def win_rate(self) -> float:
+        """Win rate over the last `window` rounds."""
+        return self.wins / self.count if self.count else 0.0
+
+
+    def most_played(self) -> Optional[str]:
+        """Player 1's most played move so far."""
+        if not self.count:
+            return None
+        return max(self.move_counts, key=self.move_counts.get)
+
+
+    def display(self) -> None:
+        """Print the live stats, at most `refresh_rate` times per second."""
+        now = time.monotonic()
+        if now - self.last_display < self.refresh_interval:
+            return
+        self.last_display = now
+
+        streak_names = {"win": "win", "lose": "loss", "tie": "tie"}
+        streak = f"{self.streak_length} {streak_names[self.streak_result]}{'' if self.streak_length == 1 else 's'}" if self.streak_result else "-"
+        move = self.most_played()
+        favourite = f"{move.capitalize()} {CHOICES[move]}" if move else "-"
+        print(f"Last {self.count} rounds: {self.win_rate():.0%} wins | Streak: {streak} | Most played: {favourite}")
+
+
+class Checkpoint:
+    def __init__(self, path: str = CHECKPOINT_FILE, interval: int = CHECKPOINT_INTERVAL):
+        """
+        Append-only checkpoint of an in-progress game.
+        :param path: Checkpoint file (one JSON object per line)
+        :param interval: Number of rounds between writes
+        """
+        self.path = path
+        self.interval = max(1, interval)
+        self.header: Dict[str, Any] = {}
+        self.pending = 0
+
+
+    def start(self, mode: str, player1: str, player2: str, rounds: Optional[int] = None, time_limit: Optional[int] = None, computer: Optional[str] = None) -> None:
+        """Begin a fresh checkpoint file for a new game."""
+        self.header = {
+            "Mode": mode,
+            "Player 1": player1,
+            "Player 2": player2,
+            "Rounds": rounds,
+            "Time Limit": time_limit,
+            "Computer": computer,
+        }
+        self.pending = 0
+        try:
+            open(self.path, "w").close()
+        except IOError as e:
+            logging.error(f"Failed to create checkpoint: {e}")
+
+
+    def resume(self, state: Dict[str, Any]) -> None:
+        """Continue appending to the checkpoint of a resumed game."""
+        self.header = {key: state.get(key) for key in ("Mode", "Player 1", "Player 2", "Rounds", "Time Limit", "Computer")}
+        self.pending = 0
+
+        # Cut off a partially written last line from a crash, so new entries
+        # start on a line of their own instead of being glued onto it
+        try:
+            with open(self.path, "rb+") as file:
+                data = file.read()
+                file.truncate(data.rfind(b"\n") + 1)
+        except FileNotFoundError:
+            pass
+        except IOError as e:
+            logging.error(f"Failed to repair checkpoint: {e}")
+
+
+    def tick(self) -> bool:
+        """Count a finished round and report whether a write is due."""
+        self.pending += 1
+        return self.pending >= self.interval
+
+
+    def save(self, progress: Dict[str, Any]) -> None:
+        """Append the current game state to the checkpoint file."""
+        state = {**self.header, **progress, "RNG State": random.getstate()}
+        try:
+            with open(self.path, "a") as file:
+                file.write(json.dumps(state) + "\n")
+        except IOError as e:
+            logging.error(f"Failed to write checkpoint: {e}")
+        self.pending = 0
+
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the latest complete checkpoint, or None if there is none.
+        Each entry only holds the moves made since the previous one, so the
+        full move sequences are rebuilt here.
+        """
+        state = None
+        sequences: Tuple[List[str], List[str]] = ([], [])
+        try:
+            with open(self.path, "r") as file:
+                for line in file:
+                    try:
+                        state = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A partially written last line from a crash
+                        logging.debug("Skipping corrupt checkpoint entry.")
+                        continue
+                    sequences[0].extend(state.get("Player 1 New Moves", []))
+                    sequences[1].extend(state.get("Player 2 New Moves", []))
+        except FileNotFoundError:
+            return None
+        if state:
+            state["Player 1 Sequence"], state["Player 2 Sequence"] = sequences
+        return state
+
+
+    def clear(self) -> None:
+        """Remove the checkpoint once the game has been recorded."""
+        self.header = {}
+        self.pending = 0
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+    @staticmethod
+    def restore_rng(state: Dict[str, Any]) -> None:
+        """Restore the random generator so the computer continues the same sequence."""
+        rng_state = state.get("RNG State")
+        if rng_state:
+            version, internal, gauss_next = rng_state
+            random.setstate((version, tuple(internal), gauss_next))
+
+
+class ComputerStrategy:
+    """Computer opponent that picks uniformly at random."""
+    name = "Random"
+
+    def choose(self) -> str:
+        """Pick the computer's move for the next round."""
+        return random.choice(list(CHOICES.keys()))
+
+
+    def observe(self, opponent_choice: str) -> None:
+        """Learn from the opponent's move once the round is over."""
+
+
+class BeatLastStrategy(ComputerStrategy):
+    """Plays the move that beats the opponent's previous move."""
+    name = "Beat Last"
+
+    def __init__(self):
+        self.last_choice: Optional[str] = None
+
+
+    def choose(self) -> str:
+        if self.last_choice is None:
+            return super().choose()
+        return BEATEN_BY[self.last_choice]
+
+
+    def observe(self, opponent_choice: str) -> None:
+        self.last_choice = opponent_choice
+
+
+class FrequencyStrategy(ComputerStrategy):
+    """Plays the move that beats the opponent's most frequent move."""
+    name = "Frequency"
+
+    def __init__(self):
+        self.counts = {choice: 0 for choice in CHOICES}
+
+
+    def choose(self) -> str:
+        if not any(self.counts.values()):
+            return super().choose()
+        return BEATEN_BY[max(self.counts, key=self.counts.get)]
+
+
+    def observe(self, opponent_choice: str) -> None:
+        self.counts[opponent_choice] += 1
+
+
+class TrainedStrategy(ComputerStrategy):
+    """Plays the mixed strategy saved by the regret-matching trainer."""
+    name = "Trained"
+
+    def __init__(self, path: str = TRAINED_STRATEGY):
+        self.probabilities = TrainedStrategy.load_probabilities(path)
+
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def load_probabilities(path: str) -> Dict[str, float]:
+        """Load the trained move probabilities, falling back to uniform."""
+        try:
+            with open(path, "r") as file:
+                probabilities = json.load(file)["Strategy"]
+            return {choice: float(probabilities[choice]) for choice in CHOICES}
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+            logging.warning("No trained strategy found. The trained computer will play at random.")
+            return {choice: 1 / len(CHOICES) for choice in CHOICES}
+
+
+    def choose(self) -> str:
+        return random.choices(list(self.probabilities), weights=list(self.probabilities.values()))[0]
+
+
+COMPUTER_STRATEGIES = {
+    "random": ComputerStrategy,
+    "beat_last": BeatLastStrategy,
+    "frequency": FrequencyStrategy,
+    "trained": TrainedStrategy,
+}
+
+
+class Backtest:
+    @staticmethod
+    def read_sequences(path: str = MOVE_LOG):
+        """Stream (player, moves) for every human player in the move log."""
+        for record in Stats.load_moves(path):
+            yield record["Player 1"], record["Player 1 Sequence"]
+            if record["Player 2"] != "Computer":
+                yield record["Player 2"], record["Player 2 Sequence"]
+
+
+    @staticmethod
+    def replay_shard(strategy_names: List[str], shard: List[Tuple[str, List[str]]]) -> Dict[str, List[Tuple[str, int, int, int]]]:
+        """
+        Replay each strategy against each move sequence in a shard.
+        :return: (player, strategy wins, strategy losses, draws) per sequence, for each strategy
+        """
+        results: Dict[str, List[Tuple[str, int, int, int]]] = {name: [] for name in strategy_names}
+        for player, moves in shard:
+            for strategy_name in strategy_names:
+                strategy = COMPUTER_STRATEGIES[strategy_name]()
+                outcomes = {"win": 0, "lose": 0, "tie": 0}
+                for move in moves:
+                    outcomes[Utilities.round_outcome(strategy.choose(), move)] += 1
+                    strategy.observe(move)
+                results[strategy_name].append((player, outcomes["win"], outcomes["lose"], outcomes["tie"]))
+        return results
+
+
+    @staticmethod
+    def run(strategy_names: Optional[List[str]] = None, path: str = MOVE_LOG, workers: Optional[int] = None, shard_size: int = BACKTEST_SHARD_SIZE) -> Dict[str, Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]]:
+        """
+        Backtest computer strategies against the recorded human move sequences.
+        The log is read once and every strategy is replayed on each shard.
+        :param strategy_names: Keys of the strategies in COMPUTER_STRATEGIES (None for all)
+        :param path: Move log to read sequences from
+        :param workers: Number of worker processes (None for one per CPU)
+        :param shard_size: Number of sequences sent to a worker at a time
+        :return: For each strategy, per-player results keyed by normalized name and the aggregate results
+        """
+        strategy_names = list(strategy_names or COMPUTER_STRATEGIES)
+        for strategy_name in strategy_names:
+            if strategy_name not in COMPUTER_STRATEGIES:
+                raise ValueError(f"Unknown strategy: {strategy_name}")
+
+        results = {
+            name: ({}, {"Sequences": 0, "Rounds": 0, "Wins": 0, "Losses": 0, "Draws": 0})
+            for name in strategy_names
+        }
+
+        def collect(shard_results: Dict[str, List[Tuple[str, int, int, int]]]) -> None:
+            for strategy_name, sequence_results in shard_results.items():
+                per_player, totals = results[strategy_name]
+                for player, wins, losses, draws in sequence_results:
+                    entry = per_player.setdefault(PlayerProfiles.normalize(player), {
+                        "Name": player, "Sequences": 0, "Rounds": 0, "Wins": 0, "Losses": 0, "Draws": 0,
+                    })
+                    for target in (entry, totals):
+                        target["Sequences"] += 1
+                        target["Rounds"] += wins + losses + draws
+                        target["Wins"] += wins
+                        target["Losses"] += losses
+                        target["Draws"] += draws
+
+        # Only start the worker pool when there is something to replay
+        sequences = Backtest.read_sequences(path)
+        first = next(sequences, None)
+        if first is None:
+            return results
+
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Keep a bounded number of shards in flight so the log is streamed
+            max_pending = 2 * workers
+            pending = set()
+            shard: List[Tuple[str, List[str]]] = []
+            for sequence in chain([first], sequences):
+                shard.append(sequence)
+                if len(shard) < shard_size:
+                    continue
+                pending.add(executor.submit(Backtest.replay_shard, strategy_names, shard))
+                shard = []
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future.result())
+            if shard:
+                pending.add(executor.submit(Backtest.replay_shard, strategy_names, shard))
+            for future in pending:
+                collect(future.result())
+
+        return results
+
+
+    @staticmethod
+    def display_results(strategy_name: str, per_player: Dict[str, Dict[str, Any]], totals: Dict[str, int]) -> None:
+        """Print per-player and aggregate backtest results for a strategy."""
+        print(f"\nBacktest: {COMPUTER_STRATEGIES[strategy_name].name}")
+        print("-" * 40)
+        for entry in list(per_player.values()) + [{"Name": "All players", **totals}]:
+            win_rate = entry["Wins"] / entry["Rounds"] if entry["Rounds"] else 0.0
+            print(f"{entry['Name']}: {entry['Wins']} wins, {entry['Losses']} losses, {entry['Draws']} draws in {entry['Rounds']} rounds ({win_rate:.0%})")
+        print("-" * 40)
+
+
+class RegretMatchingTrainer:
+    def __init__(self, weights: Optional[Dict[str, float]] = None, chains: int = TRAINER_CHAINS, batch_size: int = TRAINER_BATCH_SIZE, seed: Optional[int] = None):
+        """
+        Self-play regret matching over the game's payoff matrix, vectorized
+        across `chains` independent self-play chains run in lockstep.
+        Each chain keeps its own regret vector, starts from random regrets and
+        updates them every iteration with the exact expected payoff against its
+        current strategy, so one NumPy operation advances every chain by one
+        iteration. The trained strategy is the average over all chains.
+        :param weights: Payoff of a win with each move (default 1 for every move)
+        :param chains: Number of self-play chains trained side by side
+        :param batch_size: Number of iterations whose exploitability is computed together
+        :param seed: Seed for the random starting regrets
+        """
+        if np is None:
+            raise ImportError("NumPy is required to train strategies.")
+
+        self.moves = list(CHOICES.keys())
+        self.weights = {move: 1.0 for move in self.moves}
+        self.weights.update(weights or {})
+        self.payoffs = RegretMatchingTrainer.payoff_matrix(self.weights)
+        self.chains = max(1, chains)
+        self.batch_size = max(1, batch_size)
+        rng = np.random.default_rng(seed)
+        # Random starting regrets so the chains follow different trajectories
+        self.regrets = rng.random((self.chains, len(self.moves))) * max(self.weights.values())
+        self.strategy_sum = np.zeros(len(self.moves))
+        self.iterations = 0  # Iterations run by every chain
+        self.exploitability: List[Any] = []  # Exploitability after each iteration, one array per batch
+        self.elapsed = 0.0
+
+
+    @staticmethod
+    def payoff_matrix(weights: Dict[str, float]):
+        """
+        Payoff to the row move against the column move, built from WINNING_COMBOS.
+        A win pays the winning move's weight and the loser pays the same amount.
+        """
+        moves = list(CHOICES.keys())
+        payoffs = np.zeros((len(moves), len(moves)))
+        for i, move in enumerate(moves):
+            j = moves.index(WINNING_COMBOS[move])
+            payoffs[i, j] = weights[move]
+            payoffs[j, i] = -weights[move]
+        return payoffs
+
+
+    def current_strategies(self):
+        """Regret-matching strategy of every chain: positive regrets, normalized (uniform if there are none)."""
+        positive = np.maximum(self.regrets, 0)
+        totals = positive.sum(axis=1, keepdims=True)
+        uniform = np.full_like(positive, 1 / len(self.moves))
+        return np.divide(positive, totals, out=uniform, where=totals > 0)
+
+
+    def run_batch(self, count: int) -> None:
+        """Advance every chain by `count` iterations and record the exploitability after each one."""
+        strategy_sums = np.empty((count, len(self.moves)))
+        for t in range(count):
+            strategies = self.current_strategies()
+            # Exact expected payoff of each move against each chain's (identical) opponent
+            utilities = strategies @ self.payoffs.T
+            expected = (strategies * utilities).sum(axis=1, keepdims=True)
+            self.regrets += utilities - expected
+            strategy_sums[t] = strategies.sum(axis=0)
+
+        # Average strategy over all chains and its exploitability after every iteration of the batch
+        sums = self.strategy_sum + strategy_sums.cumsum(axis=0)
+        averages = sums / sums.sum(axis=1, keepdims=True)
+        self.exploitability.append(np.maximum((averages @ self.payoffs.T).max(axis=1), 0.0))
+        self.strategy_sum = sums[-1]
+        self.iterations += count
+
+
+    def average_strategy(self) -> Dict[str, float]:
+        """The average strategy, which converges to an equilibrium."""
+        total = self.strategy_sum.sum()
+        if total <= 0:
+            return {move: 1 / len(self.moves) for move in self.moves}
+        return {move: float(p) for move, p in zip(self.moves, self.strategy_sum / total)}
+
+
+    def exploitability_of(self, strategy: Dict[str, float]) -> float:
+        """
+        Best-response payoff against a strategy. The game is symmetric and
+        zero-sum, so its value is 0 and an equilibrium has exploitability 0.
+        """
+        probabilities = np.array([strategy[move] for move in self.moves])
+        return float(max((self.payoffs @ probabilities).max(), 0.0))
+
+
+    def exploitability_curve(self):
+        """Exploitability of the average strategy after each iteration so far."""
+        if not self.exploitability:
+            return np.empty(0)
+        return np.concatenate(self.exploitability)
+
+
+    def train(self, iterations: int) -> Dict[str, float]:
+        """
+        Run every chain for `iterations` self-play iterations (regret updates).
+        :return: The average strategy
+        """
+        start_time = time.perf_counter()
+        remaining = iterations
+        while remaining > 0:
+            count = min(remaining, self.batch_size)
+            self.run_batch(count)
+            remaining -= count
+        self.elapsed += time.perf_counter() - start_time
+        return self.average_strategy()
+
+
+    def total_iterations(self) -> int:
+        """Iterations run across all chains."""
+        return self.iterations * self.chains
+
+
+    def iterations_per_second(self) -> float:
+        """Throughput across all chains."""
+        return self.total_iterations() / self.elapsed if self.elapsed else 0.0
+
+
+    def save(self, path: str = TRAINED_STRATEGY) -> None:
+        """Save the average strategy for the trained computer opponent."""
+        try:
+            with open(path, "w") as file:
+                json.dump({
+                    "Weights": self.weights,
+                    "Iterations": self.iterations,
+                    "Chains": self.chains,
+                    "Exploitability": self.exploitability_of(self.average_strategy()),
+                    "Strategy": self.average_strategy(),
+                }, file, indent=4)
+        except IOError as e:
+            logging.error(f"Failed to save trained strategy: {e}")
+            raise
+        TrainedStrategy.load_probabilities.cache_clear()
+
+
+class PlayerProfiles:
+    def __init__(self, path: str = PLAYER_PROFILES):
+        """
+        Lifetime player profiles, indexed by normalized name.
+        :param path: JSON file holding the profile index
+        """
+        self.path = path
+        self.profiles = self.load_profiles()
+
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Key used for a player's profile (case and spacing insensitive)."""
+        return " ".join(name.split()).lower()
+
+
+    def load_profiles(self) -> Dict[str, Dict[str, Any]]:
+        """Load the profile index from its JSON file."""
+        try:
+            with open(self.path, "r") as file:
+                data = json.load(file)
+                if isinstance(data, dict):
+                    return data
+                logging.warning("Player profiles file format is invalid. Starting with no profiles.")
+                return {}
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError:
+            logging.debug("Error decoding the player profiles file. Starting with no profiles.")
+            return {}
+
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Look up a player's profile by name."""
+        return self.profiles.get(self.normalize(name))
+
+
+    def greet(self, name: str, opponent: str) -> None:
+        """Welcome a returning player with their lifetime and head-to-head record."""
+        profile = self.get(name)
+        if not profile:
+            print(f"Welcome, {name}!")
+            return
+
+        moves = profile["Moves"]
+        favourite = max(moves, key=moves.get)
+        print(f"Welcome back, {profile['Name']}! Last played on {profile['Last Played']}.")
+        print(f"Lifetime: {profile['Wins']} wins, {profile['Losses']} losses, {profile['Draws']} draws in {profile['Games']} games. Favourite move: {favourite.capitalize()} {CHOICES[favourite]}")
+        record = profile["Head To Head"].get(self.normalize(opponent))
+        if record:
+            print(f"Against {opponent}: {record['Wins']} wins, {record['Losses']} losses, {record['Draws']} draws.")
+
+
+    def record_game(self, player: str, opponent: str, wins: int, losses: int, draws: int, moves: Dict[str, int]) -> None:
+        """Add one game to a player's profile in place."""
+        profile = self.profiles.setdefault(self.normalize(player), {
+            "Name": player,
+            "Games": 0,
+            "Wins": 0,
+            "Losses": 0,
+            "Draws": 0,
+            "Moves": {choice: 0 for choice in CHOICES},
+            "Last Played": None,
+            "Head To Head": {},
+        })
+        profile["Name"] = player
+        profile["Games"] += 1
+        profile["Wins"] += wins
+        profile["Losses"] += losses
+        profile["Draws"] += draws
+        for choice, count in moves.items():
+            profile["Moves"][choice] += count
+        profile["Last Played"] = datetime.now().strftime("%Y-%m-%d")
+
+        record = profile["Head To Head"].setdefault(self.normalize(opponent), {"Wins": 0, "Losses": 0, "Draws": 0})
+        record["Wins"] += wins
+        record["Losses"] += losses
+        record["Draws"] += draws
+
+
+    def save_profiles(self) -> None:
+        """Write the profile index to its JSON file."""
+        try:
+            with open(self.path, "w") as file:
+                json.dump(self.profiles, file)
+        except IOError as e:
+            logging.error(f"Failed to save player profiles: {e}")
+
+
 class PlayGame:
+    def __init__(self):
+        self.profiles = PlayerProfiles()
+        self.move_counts: Tuple[Dict[str, int], Dict[str, int]] = ({}, {})  # Moves of each player in the last game
+        self.move_history: Tuple[List[str], List[str]] = ([], [])  # Move sequence of each player in the last game
+        self.set_computer("random")
+
+
+    def set_computer(self, strategy_name: str) -> None:
+        """Use the given strategy for the computer opponent."""
+        self.computer_name = strategy_name
+        self.computer = COMPUTER_STRATEGIES[strategy_name]()
+
+
+    def computer_label(self) -> str:
+        """Name of the current computer opponent, used for head-to-head records."""
+        return f"Computer ({COMPUTER_STRATEGIES[self.computer_name].name})"
+
+
+    def select_computer(self) -> None:
+        """Let the player choose which computer opponent to face."""
+        names = list(COMPUTER_STRATEGIES)
+        print("\nComputer opponents:")
+        for i, name in enumerate(names, 1):
+            print(f"{i}. {COMPUTER_STRATEGIES[name].name}")
+        choice = Utilities.get_valid_input(f"Choose an opponent (1-{len(names)}): ", is_numeric=True, min_value=1, max_value=len(names))
+        self.set_computer(names[choice - 1])
+
+
     def get_players(self, mode: str) -> tuple[str, str]:
         """Get players names based on the mode."""
         if mode == "Single Player":
-            return Utilities.get_valid_name("Enter your name: "), "Computer"
+            player1, player2 = Utilities.get_valid_name("Enter your name: "), "Computer"
+            self.select_computer()
+            self.profiles.greet(player1, self.computer_label())
+            return player1, player2
         elif mode == "Multiplayer":
             player1 = Utilities.get_valid_name("Enter name of Player 1: ")
             player2 = Utilities.get_valid_name("Enter name of Player 2: ")
+            self.profiles.greet(player1, player2)
+            self.profiles.greet(player2, player1)
             return player1, player2
         elif mode == "Timed Mode":
-            return Utilities.get_valid_name("Enter your name: "), "Computer"
+            player1, player2 = Utilities.get_valid_name("Enter your name: "), "Computer"
+            self.select_computer()
+            self.profiles.greet(player1, self.computer_label())
+            return player1, player2
         else:
             raise ValueError(f"Unknown mode: {mode}")
     
 
-    def play_round(self, player1: str, player2: str, is_hidden: bool = False, time_limit: Optional[int] = None) -> str:
-        """Play a single round and return the result."""
+    def play_round(self, player1: str, player2: str, is_hidden: bool = False, time_limit: Optional[int] = None) -> Tuple[str, str, str]:
+        """Play a single round and return the result with both players' choices."""
         if player2 == "Computer":
             player1_choice = Utilities.get_valid_choice(player1, is_hidden, time_limit)
-            player2_choice = random.choice(list(CHOICES.keys()))
+            player2_choice = self.computer.choose()
+            self.computer.observe(player1_choice)
         else:
             player1_choice = Utilities.get_valid_choice(f"(Hidden): {player1}", is_hidden)
             player2_choice = Utilities.get_valid_choice(f"(Hidden): {player2}", is_hidden)
         
         print(f"{player1} chose: {player1_choice.capitalize()} \n{player2} chose: {player2_choice.capitalize()}")
 
-        return Utilities.determine_winner(player1_choice, player2_choice, player1)
+        return Utilities.determine_winner(player1_choice, player2_choice, player1), player1_choice, player2_choice
     
 
-    def play_game(self, player1: str, player2: str, rounds: Optional[int] = None, time_limit: Optional[int] = None, is_hidden: bool = False) -> Tuple[int, int, int, int]:
+    def play_game(self, player1: str, player2: str, rounds: Optional[int] = None, time_limit: Optional[int] = None, is_hidden: bool = False, checkpoint: Optional[Checkpoint] = None, resume: Optional[Dict[str, Any]] = None, live_stats: Optional[RollingStats] = None) -> Tuple[int, int, int, int]:
         """
         Main game loop for both timed and untimed modes.
         :param player1: Name of player 1 (str)
         :param player2: Name of player 2 (str)
         :param rounds: Total number of rounds to play (int) (None for timed mode).
         :param time_limit: Time limit for the game in seconds (float) (None for untimed mode).
+        :param checkpoint: Checkpoint to write progress to every few rounds (None to disable).
+        :param resume: Checkpointed state to continue from (None for a new game).
+        :param live_stats: Rolling stats to update and show after each round (None to disable).
         :return: Tuple containing player 1 wins, player 2 wins, draws, and rounds played.
         """
         p1_wins, p2_wins, draws = 0, 0, 0
         rounds_played = 0
-        start_time = time.monotonic() if time_limit else None
+        elapsed_before = 0.0
+        self.move_counts = ({choice: 0 for choice in CHOICES}, {choice: 0 for choice in CHOICES})
+        self.move_history = ([], [])
+        if resume:
+            p1_wins = resume.get("Player 1 Wins", 0)
+            p2_wins = resume.get("Player 2 Wins", 0)
+            draws = resume.get("Draws", 0)
+            rounds_played = resume.get("Rounds Played", 0)
+            elapsed_before = resume.get("Elapsed Time", 0.0)
+            self.move_counts[0].update(resume.get("Player 1 Moves", {}))
+            self.move_counts[1].update(resume.get("Player 2 Moves", {}))
+            self.move_history[0].extend(resume.get("Player 1 Sequence", []))
+            self.move_history[1].extend(resume.get("Player 2 Sequence", []))
+            if player2 == "Computer":
+                # Bring the computer back up to speed on the moves it has seen
+                self.set_computer(resume.get("Computer") or "random")
+                for move in self.move_history[0]:
+                    self.computer.observe(move)
+            Checkpoint.restore_rng(resume)
+        start_time = time.monotonic() - elapsed_before
+        saved_moves = rounds_played  # Moves already in the checkpoint
+
+        def progress() -> Dict[str, Any]:
+            nonlocal saved_moves
+            new_moves = (self.move_history[0][saved_moves:], self.move_history[1][saved_moves:])
+            saved_moves = rounds_played
+            return {
+                "Player 1 Wins": p1_wins,
+                "Player 2 Wins": p2_wins,
+                "Draws": draws,
+                "Rounds Played": rounds_played,
+                "Elapsed Time": time.monotonic() - start_time,
+                "Player 1 Moves": self.move_counts[0],
+                "Player 2 Moves": self.move_counts[1],
+                "Player 1 New Moves": new_moves[0],
+                "Player 2 New Moves": new_moves[1],
+            }
 
         # Loop based on rounds or time limit
-        while True:
-            # Check if the time limit has been reached
-            if time_limit and time.monotonic() - start_time >= time_limit:
-                print("Time's up!")
-                break
-
-            if time_limit:
-                elapsed_time = time.monotonic() - start_time
-                remaining_time = max(0, time_limit - elapsed_time)
-                print(f"\nTime remaining: {remaining_time: .2f} seconds")
-            
-            # Check if a specific number of rounds has been completed (only for untimed mode)
-            if rounds and rounds_played >= rounds:
-                break
-
-            # Play one round
-            print(f"\nRound {rounds_played + 1}:")
-            result = self.play_round(player1, player2, is_hidden)
-
-            # Update scores based on the result
-            if result == "win":
-                p1_wins += 1
-            elif result == "lose":
-                p2_wins += 1
-            else:
-                draws += 1
+        try:
+            while True:
+                # Check if the time limit has been reached
+                if time_limit and time.monotonic() - start_time >= time_limit:
+                    print("Time's up!")
+                    break
+
+                if time_limit:
+                    elapsed_time = time.monotonic() - start_time
+                    remaining_time = max(0, time_limit - elapsed_time)
+                    print(f"\nTime remaining: {remaining_time: .2f} seconds")
+
+                # Check if a specific number of rounds has been completed (only for untimed mode)
+                if rounds and rounds_played >= rounds:
+                    break
+
+                # Play one round
+                print(f"\nRound {rounds_played + 1}:")
+                result, player1_choice, player2_choice = self.play_round(player1, player2, is_hidden)
+
+                # Update scores based on the result
+                if result == "win":
+                    p1_wins += 1
+                elif result == "lose":
+                    p2_wins += 1
+                else:
+                    draws += 1
+
+                # Increment the rounds played counter
+                rounds_played += 1
+                self.move_counts[0][player1_choice] += 1
+                self.move_counts[1][player2_choice] += 1
+                self.move_history[0].append(player1_choice)
+                self.move_history[1].append(player2_choice)
+
+                if live_stats:
+                    live_stats.update(result, player1_choice)
+                    live_stats.display()
+
+                # Write a checkpoint once every batch of rounds
+                if checkpoint and checkpoint.tick():
+                    checkpoint.save(progress())
+        except BaseException:
+            # Keep the rounds played since the last batch before exiting
+            if checkpoint and checkpoint.pending:
+                checkpoint.save(progress())
+            raise
 
-            # Increment the rounds played counter
-            rounds_played += 1
-        
         return p1_wins, p2_wins, draws, rounds_played
     
 
@@ -256,21 +1272,39 @@ class PlayGame:
         })
         Stats.display_stats(stats)
         Stats.save_stats_to_file(stats)
+        Stats.save_moves_to_file({
+            "Mode": mode,
+            "Player 1": player1,
+            "Player 2": player2,
+            "Date": stats["Date"],
+            "Player 1 Sequence": self.move_history[0],
+            "Player 2 Sequence": self.move_history[1],
+        })
+
+        # Keep the player profiles in step with the saved stats
+        opponent = self.computer_label() if player2 == "Computer" else player2
+        self.profiles.record_game(player1, opponent, p1_wins, p2_wins, draws, self.move_counts[0])
+        if player2 != "Computer":
+            self.profiles.record_game(player2, player1, p2_wins, p1_wins, draws, self.move_counts[1])
+        self.profiles.save_profiles()
 
 
 class GameMode:
     def __init__(self):
         self.play_game = PlayGame()  # Create an instance of PlayGame
+        self.checkpoint = Checkpoint()  # Saves in-progress games for resuming
     
 
     def single_player_mode(self, rounds: int, stats: Dict[str, int | str]) -> None:
         """Handle single player mode."""
         player1, player2 = self.play_game.get_players("Single Player")
 
-        p1_wins, p2_wins, draws, rounds = self.play_game.play_game(player1, player2, rounds)
+        self.checkpoint.start("Single Player", player1, player2, rounds, computer=self.play_game.computer_name)
+        p1_wins, p2_wins, draws, rounds = self.play_game.play_game(player1, player2, rounds, checkpoint=self.checkpoint, live_stats=RollingStats())
 
         overall_winner = self.determine_overall_winner(p1_wins, p2_wins, rounds, player1, player2)
         self.play_game.update_statistics(stats, "Single Player", player1, player2, p1_wins, p2_wins, draws, rounds)
+        self.checkpoint.clear()
     
 
     def multiplayer_mode(self, rounds: int, stats: Dict[str, int | str]) -> None:
@@ -280,11 +1314,13 @@ class GameMode:
         # Enable hidden input for multiplayer
         is_hidden = True
         print("\nInput will be hidden for multiplayer mode.")
-        p1_wins, p2_wins, draws, rounds = self.play_game.play_game(player1, player2, rounds, is_hidden=is_hidden)
+        self.checkpoint.start("Multiplayer", player1, player2, rounds)
+        p1_wins, p2_wins, draws, rounds = self.play_game.play_game(player1, player2, rounds, is_hidden=is_hidden, checkpoint=self.checkpoint, live_stats=RollingStats())
 
         # Determine overall winner
         overall_winner = self.determine_overall_winner(p1_wins, p2_wins, rounds, player1, player2)
         self.play_game.update_statistics(stats, "Multiplayer", player1, player2, p1_wins, p2_wins, draws, rounds)
+        self.checkpoint.clear()
 
 
     def timed_mode(self, stats: Dict[str, int | str]) -> None:
@@ -299,7 +1335,8 @@ class GameMode:
 
         # Start the game
         print(f"\n{player1}, your time starts now! You have {time_limit} secons to play.")
-        p1_wins, p2_wins, draws, rounds_played = self.play_game.play_game(player1, player2, time_limit=time_limit)
+        self.checkpoint.start("Timed", player1, player2, time_limit=time_limit, computer=self.play_game.computer_name)
+        p1_wins, p2_wins, draws, rounds_played = self.play_game.play_game(player1, player2, time_limit=time_limit, checkpoint=self.checkpoint, live_stats=RollingStats())
 
         # Display results
         print(f"\nGame Over! You played {rounds_played} rounds in {time_limit} seconds.")
@@ -309,6 +1346,50 @@ class GameMode:
 
         # Update statistics
         self.play_game.update_statistics(stats, "Timed", player1, player2, p1_wins, p2_wins, draws, rounds_played, time_limit)
+        self.checkpoint.clear()
+
+
+    def confirm_new_game(self, stats: Dict[str, int | str]) -> bool:
+        """
+        Check for an unfinished saved game before a new game overwrites it.
+        :return: True to start the new game, False if the saved game was resumed instead
+        """
+        state = self.checkpoint.load()
+        if not state:
+            return True
+
+        print(f"\nYou have an unfinished {state['Mode']} game: {state['Player 1']} vs {state['Player 2']} after {state['Rounds Played']} rounds.")
+        print("1. Resume the saved game")
+        print("2. Start a new game (the saved game will be lost)")
+        choice = Utilities.get_valid_input("Choose an option (1-2): ", is_numeric=True, min_value=1, max_value=2)
+        if choice == 1:
+            self.resume_game(stats)
+            return False
+        return True
+
+
+    def resume_game(self, stats: Dict[str, int | str]) -> None:
+        """Resume the game saved in the checkpoint file."""
+        state = self.checkpoint.load()
+        if not state:
+            print("\nNo saved game to resume.")
+            return
+
+        mode = state["Mode"]
+        player1, player2 = state["Player 1"], state["Player 2"]
+        rounds, time_limit = state["Rounds"], state["Time Limit"]
+        is_hidden = mode == "Multiplayer"
+        live_stats = RollingStats()
+        live_stats.replay(state["Player 1 Sequence"], state["Player 2 Sequence"])
+        print(f"\nResuming {mode} game: {player1} vs {player2} from round {state['Rounds Played'] + 1}.")
+
+        self.checkpoint.resume(state)
+        p1_wins, p2_wins, draws, rounds_played = self.play_game.play_game(player1, player2, rounds, time_limit, is_hidden, checkpoint=self.checkpoint, resume=state, live_stats=live_stats)
+
+        # Determine overall winner
+        overall_winner = self.determine_overall_winner(p1_wins, p2_wins, rounds_played, player1, player2)
+        self.play_game.update_statistics(stats, mode, player1, player2, p1_wins, p2_wins, draws, rounds_played, time_limit)
+        self.checkpoint.clear()
 
 
     def determine_overall_winner(self, p1_wins: int, p2_wins: int, rounds: int, player1: str, player2: str) -> str:
@@ -359,6 +1440,79 @@ class GameMode:
                 print("-" * 40)
 
 
+    @staticmethod
+    def backtest_strategies() -> None:
+        """Backtest every computer strategy against the recorded human moves."""
+        results = Backtest.run()
+        if not any(totals["Sequences"] for _, totals in results.values()):
+            print("\nNo recorded moves to backtest against.")
+            return
+        for strategy_name, (per_player, totals) in results.items():
+            Backtest.display_results(strategy_name, per_player, totals)
+
+
+    @staticmethod
+    def train_strategy() -> None:
+        """Train the computer's mixed strategy by regret-matching self-play."""
+        weights = {}
+        for choice in CHOICES:
+            weights[choice] = Utilities.get_valid_input(f"Enter the points for a win with {choice.capitalize()} {CHOICES[choice]} (1-10): ", is_numeric=True, min_value=1, max_value=10)
+        iterations = Utilities.get_valid_input(f"Enter the number of self-play iterations per chain ({TRAINER_CHAINS} chains): ", is_numeric=True, min_value=1)
+
+        try:
+            trainer = RegretMatchingTrainer(weights)
+        except ImportError as e:
+            logging.error(f"Failed to train strategy: {e}")
+            return
+        strategy = trainer.train(iterations)
+
+        # Report convergence at about ten evenly spaced iterations
+        print("\nIterations: Exploitability")
+        print("-" * 40)
+        curve = trainer.exploitability_curve()
+        report_every = max(1, len(curve) // 10)
+        for i, exploitability in enumerate(curve):
+            if i % report_every == 0 or i == len(curve) - 1:
+                print(f"{i + 1}: {exploitability:.5f}")
+        print("-" * 40)
+        print("Trained strategy: " + ", ".join(f"{choice.capitalize()} {p:.1%}" for choice, p in strategy.items()))
+        print(f"Trained {trainer.iterations} iterations in each of {trainer.chains} chains ({trainer.total_iterations():,} in total) in {trainer.elapsed:.2f} seconds ({trainer.iterations_per_second():,.0f} iterations per second).")
+
+        try:
+            trainer.save()
+        except IOError:
+            return
+        print("Choose the Trained computer opponent to play against it.")
+
+
+    @staticmethod
+    def export_statistics() -> None:
+        """Export the statistics history to a CSV or .npz file."""
+        path = Utilities.get_valid_input("Enter the export file name (.csv or .npz): ")
+        try:
+            count, rounds = StatsExport.export_statistics(path)
+        except (IOError, ImportError) as e:
+            logging.error(f"Failed to export statistics: {e}")
+            return
+        print(f"Exported {count} game records to {path}.")
+        if rounds:
+            print(f"Exported {rounds} recorded rounds to {StatsExport.moves_path(path)}.")
+
+
+    @staticmethod
+    def import_statistics() -> None:
+        """Import statistics from a CSV or .npz file."""
+        path = Utilities.get_valid_input("Enter the file name to import (.csv or .npz): ")
+        try:
+            count, dropped = StatsExport.import_statistics(path)
+        except (IOError, ImportError, ValueError, KeyError) as e:
+            logging.error(f"Failed to import statistics: {e}")
+            return
+        print(f"Imported {count} game records from {path}.")
+        if dropped:
+            logging.warning(f"Only the latest {MAX_ENTRIES} game records are kept, so {dropped} older records were dropped.")
+
+
 def main():
     """Main function to run the game."""
     stats = {
@@ -379,10 +1533,19 @@ def main():
         print("1. Single Player Mode")
         print("2. Multiplayer Mode")
         print("3. Timed Mode")
-        print("4. View Statistics")
-        print("5. Exit")
+        print("4. Resume Saved Game")
+        print("5. View Statistics")
+        print("6. Export Statistics")
+        print("7. Import Statistics")
+        print("8. Backtest Computer Strategies")
+        print("9. Train Computer Strategy")
+        print("10. Exit")
+
+        user_choice = Utilities.get_valid_input("Choose an option (1-10): ", is_numeric=True, min_value=1, max_value=10)
 
-        user_choice = Utilities.get_valid_input("Choose an option (1-5): ", is_numeric=True, min_value=1, max_value=5)
+        # Check for an unfinished game before asking about a new one
+        if user_choice in (1, 2, 3) and not game_mode.confirm_new_game(stats):
+            continue
 
         if user_choice == 1:
             rounds = Utilities.get_valid_input("Enter number of rounds to play: ", is_numeric=True, min_value=1)
@@ -393,8 +1556,18 @@ def main():
         elif user_choice == 3:
             game_mode.timed_mode(stats)  # Call via instance
         elif user_choice == 4:
-            GameMode.view_statistics()
+            game_mode.resume_game(stats)  # Call via instance
         elif user_choice == 5:
+            GameMode.view_statistics()
+        elif user_choice == 6:
+            GameMode.export_statistics()
+        elif user_choice == 7:
+            GameMode.import_statistics()
+        elif user_choice == 8:
+            GameMode.backtest_strategies()
+        elif user_choice == 9:
+            GameMode.train_strategy()
+        elif user_choice == 10:
             Utilities.clear_screen()
             print("Thanks for playing. Goodbye!")
             break
@@ -0,0 +1,36 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from rock_paper_scissors_multimodes import RegretMatchingTrainer
+
+
+@pytest.mark.parametrize("weights", [
+    {"rock": 1, "paper": 1, "scissors": 1},
+    {"rock": 2, "paper": 1, "scissors": 1},
+    {"rock": 10, "paper": 1, "scissors": 1},
+    {"rock": 3, "paper": 2, "scissors": 5},
+])
+def test_trainer_reaches_weighted_equilibrium(weights):
+    """Rock is played in proportion to the scissors weight, paper to rock and scissors to paper."""
+    trainer = RegretMatchingTrainer(weights, seed=0)
+    strategy = trainer.train(10000)
+
+    total = sum(weights.values())
+    expected = {
+        "rock": weights["scissors"] / total,
+        "paper": weights["rock"] / total,
+        "scissors": weights["paper"] / total,
+    }
+    for move, probability in expected.items():
+        assert strategy[move] == pytest.approx(probability, abs=0.02)
+    assert trainer.exploitability_of(strategy) < 0.02
+
+
+def test_trainer_counts_each_regret_update_as_one_iteration():
+    trainer = RegretMatchingTrainer({"rock": 2}, chains=16, batch_size=1000, seed=0)
+    trainer.train(2500)
+
+    assert trainer.iterations == 2500
+    assert trainer.total_iterations() == 2500 * 16
+    assert len(trainer.exploitability_curve()) == 2500